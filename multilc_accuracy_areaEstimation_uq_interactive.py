@@ -22,8 +22,8 @@ Features:
     - Option to save results to a CSV file for further analysis.
 
 Requirements:
-    - Python 3.7 or higher
-    - Libraries: numpy, pandas, scipy, tkinter
+    - Python 3.8 or higher
+    - Libraries: numpy, pandas, tkinter
 
 Usage:
     - Run the script in a Python environment:
@@ -45,90 +45,73 @@ Date:
 IMPORTANT: If the error matrix has zero rows or columns, the producer's and user's accuracy are set to 0.
 """
 
+import io
 import os
+import threading
+from statistics import NormalDist
 import numpy as np
-import pandas as pd
-import scipy.stats as st
 import tkinter as tk
 from tkinter import messagebox, filedialog
 
+# Two-sided z-score for the 95% confidence level used throughout, computed once at import
+_Z_DEFAULT = NormalDist().inv_cdf(1 - (1 - 0.95) / 2)
+
 def calculate_weights(mapped_pixels):
-    total_pixels = np.sum(mapped_pixels, dtype=np.float64)
+    total_pixels = mapped_pixels.sum(dtype=np.float64)
     weights = mapped_pixels / total_pixels
-    return weights.astype(np.float64)
+    return weights, total_pixels
 
-def convert_to_area_proportion(error_matrix, weights):
-    area_proportion_matrix = np.zeros_like(error_matrix, dtype=np.float64)
-    for i in range(error_matrix.shape[0]):
-        row_total = error_matrix[i, :].sum()
-        area_proportion_matrix[i, :] = weights[i] * (error_matrix[i, :] / row_total) if row_total != 0 else 0
+def convert_to_area_proportion(error_matrix, weights, n_row):
+    # Row-wise p_ij = W_i * n_ij / n_i. in a single broadcast; rows with no samples are all zero counts and stay 0
+    area_proportion_matrix = error_matrix / np.where(n_row == 0, 1, n_row)[:, None]
+    area_proportion_matrix *= weights[:, None]
     return area_proportion_matrix
 
-def calculate_accuracy_metrics(area_proportion_matrix, error_matrix, weights, confidence_level=0.95):
-    q = area_proportion_matrix.shape[0]
-    user_accuracy, user_accuracy_se, user_accuracy_ci_lower, user_accuracy_ci_upper, user_accuracy_ci_value = ([] for _ in range(5))
-    producer_accuracy, producer_accuracy_se, producer_accuracy_ci_lower, producer_accuracy_ci_upper, producer_accuracy_ci_value = ([] for _ in range(5))
+def calculate_variance_terms(error_matrix, weights, n_row):
+    # W_i^2 n_ij/n_i. (1 - n_ij/n_i.) / (n_i. - 1) for every cell; rows with n_i. <= 1 contribute 0
+    row_ok = n_row > 1
+    row_fractions = np.divide(error_matrix, n_row[:, None], out=np.zeros_like(error_matrix, dtype=np.float64),
+                              where=row_ok[:, None])
+    variance_terms = np.where(
+        row_ok[:, None],
+        weights[:, None] ** 2 * row_fractions * (1 - row_fractions) / np.where(row_ok, n_row - 1, 1)[:, None],
+        0
+    )
+    return variance_terms
 
-    z_score = st.norm.ppf(1 - (1 - confidence_level) / 2)
+def calculate_accuracy_metrics(area_proportion_matrix, weights, n_row, n_col, variance_terms, z_score):
+    # Area proportions per row (map class) and column (reference class)
+    p_diag = np.diagonal(area_proportion_matrix)  # read-only view, no copy
+    p_row = area_proportion_matrix.sum(axis=1)
+    p_col = area_proportion_matrix.sum(axis=0)
+    row_ok = n_row > 1
+    col_ok = (n_col > 1) & (p_col != 0)
+    n_row_minus_one = np.where(row_ok, n_row - 1, 1)
 
     # User's accuracy calculations
-    for i in range(q):
-        p_ii = area_proportion_matrix[i, i]
-        p_i_dot = area_proportion_matrix[i, :].sum()
-        U_i = p_ii / p_i_dot if p_i_dot != 0 else 0
-        user_accuracy.append(U_i)
-        
-        n_i_dot = error_matrix[i, :].sum()
-        if n_i_dot > 1:
-            variance_U_i = U_i * (1 - U_i) / (n_i_dot - 1)
-            se_U_i = np.sqrt(variance_U_i)
-            user_accuracy_se.append(se_U_i)
-            ci_lower = U_i - z_score * se_U_i
-            ci_upper = U_i + z_score * se_U_i
-            user_accuracy_ci_lower.append(ci_lower)
-            user_accuracy_ci_upper.append(ci_upper)
-            user_accuracy_ci_value.append(z_score * se_U_i)
-        else:
-            user_accuracy_se.append(0)
-            user_accuracy_ci_lower.append(0)
-            user_accuracy_ci_upper.append(0)
-            user_accuracy_ci_value.append(0)
-
-    # Producer's accuracy calculations
-    for j in range(q):
-        p_jj = area_proportion_matrix[j, j]
-        p_dot_j = area_proportion_matrix[:, j].sum()
-        P_j = p_jj / p_dot_j if p_dot_j != 0 else 0
-        producer_accuracy.append(P_j)
-        
-        n_dot_j = error_matrix[:, j].sum()
-        if n_dot_j > 1:
-            variance_P_j = (1 / n_dot_j ** 2) * (
-                (n_dot_j ** 2 * (1 - P_j) ** 2 * U_i * (1 - U_i)) / (n_i_dot - 1)
-                + P_j ** 2 * sum(
-                    (error_matrix[i, j] / n_i_dot) * (1 - (error_matrix[i, j] / n_i_dot)) / (n_i_dot - 1)
-                    for i in range(q) if i != j
-                )
-            )
-            se_P_j = np.sqrt(variance_P_j)
-            producer_accuracy_se.append(se_P_j)
-            ci_lower = P_j - z_score * se_P_j
-            ci_upper = P_j + z_score * se_P_j
-            producer_accuracy_ci_lower.append(ci_lower)
-            producer_accuracy_ci_upper.append(ci_upper)
-            producer_accuracy_ci_value.append(z_score * se_P_j)
-        else:
-            producer_accuracy_se.append(0)
-            producer_accuracy_ci_lower.append(0)
-            producer_accuracy_ci_upper.append(0)
-            producer_accuracy_ci_value.append(0)
+    user_accuracy = np.divide(p_diag, p_row, out=np.zeros_like(p_diag), where=p_row != 0)
+    variance_U = np.where(row_ok, user_accuracy * (1 - user_accuracy) / n_row_minus_one, 0)
+    user_accuracy_se = np.sqrt(variance_U)
+    user_accuracy_ci_value = z_score * user_accuracy_se
+    user_accuracy_ci_lower = np.where(row_ok, user_accuracy - user_accuracy_ci_value, 0)
+    user_accuracy_ci_upper = np.where(row_ok, user_accuracy + user_accuracy_ci_value, 0)
+
+    # Producer's accuracy calculations (Olofsson et al., 2014, written with W_i = N_i. / N)
+    producer_accuracy = np.divide(p_diag, p_col, out=np.zeros_like(p_diag), where=p_col != 0)
+    omission_terms = variance_terms.sum(axis=0) - np.diagonal(variance_terms)  # sum over i != j
+    variance_P = np.divide(
+        weights ** 2 * (1 - producer_accuracy) ** 2 * variance_U
+        + producer_accuracy ** 2 * omission_terms,
+        p_col ** 2, out=np.zeros_like(p_col), where=col_ok
+    )
+    producer_accuracy_se = np.sqrt(variance_P)
+    producer_accuracy_ci_value = z_score * producer_accuracy_se
+    producer_accuracy_ci_lower = np.where(col_ok, producer_accuracy - producer_accuracy_ci_value, 0)
+    producer_accuracy_ci_upper = np.where(col_ok, producer_accuracy + producer_accuracy_ci_value, 0)
 
     # Overall accuracy calculations
-    overall_accuracy = np.trace(area_proportion_matrix)
-    overall_accuracy_variance = sum(
-        weights[i] ** 2 * user_accuracy[i] * (1 - user_accuracy[i]) / (error_matrix[i, :].sum() - 1)
-        for i in range(q) if error_matrix[i, :].sum() > 1
-    )
+    overall_accuracy = p_diag.sum()
+    overall_accuracy_variance = np.dot(weights ** 2, variance_U)
     overall_accuracy_se = np.sqrt(overall_accuracy_variance)
     overall_accuracy_ci_lower = overall_accuracy - z_score * overall_accuracy_se
     overall_accuracy_ci_upper = overall_accuracy + z_score * overall_accuracy_se
@@ -156,28 +139,16 @@ def calculate_error_adjusted_area(area_proportion_matrix, total_area):
     adjusted_areas = total_area * area_proportion_matrix.sum(axis=0)
     return adjusted_areas
 
-def calculate_standard_error_and_ci(error_matrix, weights, area_adjusted_estimates, total_area, confidence_level=0.95):
-    q = error_matrix.shape[0]
-    standard_errors = []
-
-    for j in range(q):
-        se_j_squared = 0
-        for i in range(q):
-            n_ij = error_matrix[i, j]
-            n_i_dot = error_matrix[i, :].sum()
-            if n_i_dot > 1:
-                se_j_squared += weights[i] ** 2 * (n_ij / n_i_dot) * (1 - n_ij / n_i_dot) / (n_i_dot - 1)
-        standard_errors.append(np.sqrt(se_j_squared))
-
-    area_standard_errors = [total_area * se_j for se_j in standard_errors]
-    z_score = st.norm.ppf(1 - (1 - confidence_level) / 2)
-    confidence_intervals = [
-        (
-            area_adjusted_estimates[j] - z_score * area_standard_errors[j],
-            area_adjusted_estimates[j] + z_score * area_standard_errors[j]
-        )
-        for j in range(q)
-    ]
+def calculate_standard_error_and_ci(variance_terms, area_adjusted_estimates, total_area, z_score):
+    # V(p.j) = sum_i W_i^2 n_ij/n_i. (1 - n_ij/n_i.) / (n_i. - 1), summed down each column at once
+    standard_errors = np.sqrt(variance_terms.sum(axis=0))
+
+    area_standard_errors = total_area * standard_errors
+    confidence_intervals = np.stack(
+        [area_adjusted_estimates - z_score * area_standard_errors,
+         area_adjusted_estimates + z_score * area_standard_errors],
+        axis=1
+    )
 
     return {
         "standard_errors": area_standard_errors,
@@ -189,6 +160,8 @@ def calculate_standard_error_and_ci(error_matrix, weights, area_adjusted_estimat
 def save_matrices_as_csv(error_matrix, area_proportion_matrix):
     save_path = filedialog.askdirectory(title="Select Directory to Save Matrices")
     if save_path:
+        import pandas as pd  # Imported on first save to keep GUI startup fast
+
         # Save error matrix
         error_matrix_df = pd.DataFrame(error_matrix, columns=[f"Class {j}" for j in range(num_classes)],
                                        index=[f"Class {i}" for i in range(num_classes)])
@@ -206,62 +179,85 @@ def save_matrices_as_csv(error_matrix, area_proportion_matrix):
 def run_analysis():
     try:
         pixel_size = float(entry_pixel_size.get())
-        error_matrix = np.zeros((num_classes, num_classes), dtype=np.float64)
-        mapped_pixels = np.zeros(num_classes, dtype=np.float64)
+        pasted_matrix = matrix_text.get("1.0", "end").strip()
+
+        if pasted_matrix:
+            # Parse the pasted matrix in one pass; the last column holds the mapped pixels
+            values = np.genfromtxt(io.StringIO(pasted_matrix.replace(",", " ")), dtype=np.float64, ndmin=2)
+            if values.shape != (num_classes, num_classes + 1) or np.isnan(values).any():
+                raise ValueError(
+                    f"the pasted matrix must contain {num_classes} rows of {num_classes + 1} numbers "
+                    "(error matrix counts followed by mapped pixels)"
+                )
+            error_matrix = values[:, :-1]
+            mapped_pixels = values[:, -1]
+        else:
+            error_matrix = np.zeros((num_classes, num_classes), dtype=np.float64)
+            mapped_pixels = np.zeros(num_classes, dtype=np.float64)
 
-        for i in range(num_classes):
-            for j in range(num_classes):
-                error_matrix[i, j] = float(error_entries[i][j].get())
-            mapped_pixels[i] = float(mapped_pixel_entries[i].get())
+            for i in range(num_classes):
+                for j in range(num_classes):
+                    error_matrix[i, j] = float(error_entries[i][j].get())
+                mapped_pixels[i] = float(mapped_pixel_entries[i].get())
 
-        weights = calculate_weights(mapped_pixels)
-        area_proportion_matrix = convert_to_area_proportion(error_matrix, weights)
-        total_area = np.sum(mapped_pixels) * pixel_size ** 2
-        accuracy_metrics = calculate_accuracy_metrics(area_proportion_matrix, error_matrix, weights)
-        error_adjusted_area = calculate_error_adjusted_area(area_proportion_matrix, total_area)
+        # The calculation functions assume C-contiguous float64 inputs (the pasted matrix is sliced)
+        error_matrix = np.ascontiguousarray(error_matrix, dtype=np.float64)
+        mapped_pixels = np.ascontiguousarray(mapped_pixels, dtype=np.float64)
+
+        # Sample counts per map class (rows) and reference class (columns), shared by all calculations
+        n_row = error_matrix.sum(axis=1)
+        n_col = error_matrix.sum(axis=0)
 
         # Define z-score for 95% confidence level
-        confidence_level = 0.95
-        z_score = st.norm.ppf(1 - (1 - confidence_level) / 2)
+        z_score = _Z_DEFAULT
+
+        weights, total_pixels = calculate_weights(mapped_pixels)
+        area_proportion_matrix = convert_to_area_proportion(error_matrix, weights, n_row)
+        total_area = total_pixels * pixel_size * pixel_size
+        variance_terms = calculate_variance_terms(error_matrix, weights, n_row)
+        accuracy_metrics = calculate_accuracy_metrics(area_proportion_matrix, weights, n_row, n_col, variance_terms, z_score)
+        error_adjusted_area = calculate_error_adjusted_area(area_proportion_matrix, total_area)
 
         # Calculate SE and CI (half-width) for error-adjusted areas
         area_se_and_ci = calculate_standard_error_and_ci(
-            error_matrix, weights, error_adjusted_area, total_area
+            variance_terms, error_adjusted_area, total_area, z_score
         )
         area_standard_errors = area_se_and_ci["standard_errors"]
-        area_ci_values = [z_score * se for se in area_standard_errors]  # CI half-widths
+        area_ci_values = z_score * area_standard_errors  # CI half-widths
 
         # Open a new window to display results
         results_window = tk.Toplevel(root)
         results_window.title("Results")
 
-        # Displaying formatted results
-        results_text = tk.Text(results_window, wrap="word")
-        results_text.insert("end", "User's Accuracy per Class:\n")
+        # Displaying formatted results (built as one string and inserted into the Text widget in a single call)
+        results_lines = ["User's Accuracy per Class:\n"]
         for i, (ua, se, ci) in enumerate(zip(
                 accuracy_metrics["user_accuracy"],
                 accuracy_metrics["user_accuracy_se"],
                 accuracy_metrics["user_accuracy_ci_value"])):
-            results_text.insert("end", f"  Class {i}: {ua:.4f}, SE={se:.4f}, 95% CI={ci:.4f}\n")
+            results_lines.append(f"  Class {i}: {ua:.4f}, SE={se:.4f}, 95% CI={ci:.4f}\n")
 
-        results_text.insert("end", "\nProducer's Accuracy per Class:\n")
+        results_lines.append("\nProducer's Accuracy per Class:\n")
         for i, (pa, se, ci) in enumerate(zip(
                 accuracy_metrics["producer_accuracy"],
                 accuracy_metrics["producer_accuracy_se"],
                 accuracy_metrics["producer_accuracy_ci_value"])):
-            results_text.insert("end", f"  Class {i}: {pa:.4f}, SE={se:.4f}, 95% CI={ci:.4f}\n")
+            results_lines.append(f"  Class {i}: {pa:.4f}, SE={se:.4f}, 95% CI={ci:.4f}\n")
 
-        results_text.insert(
-            "end", f"\nOverall Accuracy: {accuracy_metrics['overall_accuracy']:.4f}, "
-                   f"SE={accuracy_metrics['overall_accuracy_se']:.4f}, "
-                   f"95% CI={accuracy_metrics['overall_accuracy_ci_value']:.4f}\n"
+        results_lines.append(
+            f"\nOverall Accuracy: {accuracy_metrics['overall_accuracy']:.4f}, "
+            f"SE={accuracy_metrics['overall_accuracy_se']:.4f}, "
+            f"95% CI={accuracy_metrics['overall_accuracy_ci_value']:.4f}\n"
         )
 
-        results_text.insert("end", "\nError-Adjusted Area per Class:\n")
+        results_lines.append("\nError-Adjusted Area per Class:\n")
         for i, (area, se, ci_value) in enumerate(zip(
                 error_adjusted_area, area_standard_errors, area_ci_values)):
-            results_text.insert("end", f"  Class {i}: {area:.2f}, SE={se:.2f}, 95% CI={ci_value:.2f}\n")
+            results_lines.append(f"  Class {i}: {area:.2f}, SE={se:.2f}, 95% CI={ci_value:.2f}\n")
 
+        results_text = tk.Text(results_window, wrap="word")
+        results_text.insert("end", "".join(results_lines))
+        results_text.config(state="disabled")  # Read-only; text can still be selected and copied
         results_text.pack()
 
         # Add a button to save matrices
@@ -272,31 +268,57 @@ def run_analysis():
         def save_results():
             save_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
             if save_path:
-                # Class-based metrics
-                result_data = {
-                    "Class": [f"Class {i}" for i in range(num_classes)],
-                    "User_Accuracy": accuracy_metrics["user_accuracy"],
-                    "User_Accuracy_SE": accuracy_metrics["user_accuracy_se"],
-                    "User_Accuracy_95%CI": accuracy_metrics["user_accuracy_ci_value"],
-                    "Producer_Accuracy": accuracy_metrics["producer_accuracy"],
-                    "Producer_Accuracy_SE": accuracy_metrics["producer_accuracy_se"],
-                    "Producer_Accuracy_95%CI": accuracy_metrics["producer_accuracy_ci_value"],
-                    "Error_Adjusted_Area": error_adjusted_area,
-                    "Error_Adjusted_Area_SE": area_standard_errors,
-                    "Error_Adjusted_Area_95%CI_Value": area_ci_values,
-                }
-
-                # Adding overall metrics as separate columns (extend them to match the number of classes if needed)
-                result_data["Overall_Accuracy"] = [accuracy_metrics["overall_accuracy"]] * num_classes
-                result_data["Overall_Accuracy_SE"] = [accuracy_metrics["overall_accuracy_se"]] * num_classes
-                result_data["Overall_Accuracy_95%CI"] = [accuracy_metrics["overall_accuracy_ci_value"]] * num_classes
+                import pandas as pd  # Imported on first save to keep GUI startup fast
+
+                # Class-based metrics, followed by the overall metrics repeated for every class
+                result_columns = [
+                    "User_Accuracy", "User_Accuracy_SE", "User_Accuracy_95%CI",
+                    "Producer_Accuracy", "Producer_Accuracy_SE", "Producer_Accuracy_95%CI",
+                    "Error_Adjusted_Area", "Error_Adjusted_Area_SE", "Error_Adjusted_Area_95%CI_Value",
+                    "Overall_Accuracy", "Overall_Accuracy_SE", "Overall_Accuracy_95%CI",
+                ]
+                result_data = np.column_stack([
+                    accuracy_metrics["user_accuracy"],
+                    accuracy_metrics["user_accuracy_se"],
+                    accuracy_metrics["user_accuracy_ci_value"],
+                    accuracy_metrics["producer_accuracy"],
+                    accuracy_metrics["producer_accuracy_se"],
+                    accuracy_metrics["producer_accuracy_ci_value"],
+                    error_adjusted_area,
+                    area_standard_errors,
+                    area_ci_values,
+                    np.full(num_classes, accuracy_metrics["overall_accuracy"]),
+                    np.full(num_classes, accuracy_metrics["overall_accuracy_se"]),
+                    np.full(num_classes, accuracy_metrics["overall_accuracy_ci_value"]),
+                ])
 
                 # Convert to DataFrame
-                df_result = pd.DataFrame(result_data)
-                
-                # Save to CSV
-                df_result.to_csv(save_path, index=False)
-                messagebox.showinfo("Save Successful", f"Results saved to {save_path}")
+                df_result = pd.DataFrame(result_data, columns=result_columns)
+                df_result.insert(0, "Class", [f"Class {i}" for i in range(num_classes)])
+
+                # Save to CSV in the background so the GUI stays responsive while writing
+                write_errors = []
+
+                def write_csv():
+                    try:
+                        df_result.to_csv(save_path, index=False)
+                    except Exception as e:
+                        write_errors.append(e)
+
+                # Not a daemon thread, so exiting the application waits for the file to be fully written
+                writer = threading.Thread(target=write_csv)
+                writer.start()
+
+                # Poll from the Tk main loop; Tk calls must not be made from the worker thread
+                def report_when_done():
+                    if writer.is_alive():
+                        root.after(50, report_when_done)
+                    elif write_errors:
+                        messagebox.showerror("Error", f"An error occurred: {write_errors[0]}")
+                    else:
+                        messagebox.showinfo("Save Successful", f"Results saved to {save_path}")
+
+                root.after(50, report_when_done)
 
         tk.Button(results_window, text="Save Results as CSV", command=save_results).pack()
 
@@ -304,15 +326,10 @@ def run_analysis():
         messagebox.showerror("Error", f"An error occurred: {e}")
 
 		
-# Tooltip helper function
+# Tooltip helper function (all widgets share the single tooltip window created below)
 def create_tooltip(widget, text):
-    tooltip = tk.Toplevel(widget)
-    tooltip.withdraw()  # Hide initially
-    tooltip.overrideredirect(True)  # Remove window decorations (e.g., title bar)
-    tooltip_label = tk.Label(tooltip, text=text, background="yellow", relief="solid", borderwidth=1, font=("Arial", 8))
-    tooltip_label.pack()
-
     def show_tooltip(event):
+        tooltip_label.config(text=text)
         tooltip.geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
         tooltip.deiconify()  # Show tooltip
 
@@ -324,7 +341,7 @@ def create_tooltip(widget, text):
 
 # Function to set up matrix inputs and open matrix window
 def setup_matrix_inputs():
-    global num_classes, entry_pixel_size, error_entries, mapped_pixel_entries
+    global num_classes, entry_pixel_size, error_entries, mapped_pixel_entries, matrix_text
     try:
         num_classes = int(entry_classes.get())
         root.withdraw()  # Hide the initial window instead of destroying it
@@ -340,6 +357,8 @@ def setup_matrix_inputs():
             "2. Enter pixel size in the provided field.\n"
             "3. Fill in the error matrix with counts for each class.\n"
             "4. Enter the total mapped pixels for each class in the last column.\n"
+            "   Alternatively, paste the whole matrix (with mapped pixels as the last column) "
+            "into the text box below the grid.\n"
             "5. Click 'Run Analysis' to calculate metrics."
         )
         tk.Label(
@@ -387,10 +406,19 @@ def setup_matrix_inputs():
         # Label the column for mapped pixels
         tk.Label(matrix_window, text="Mapped Pixels").grid(row=2, column=num_classes + 1)
 
+        # Alternative bulk input: paste the matrix instead of filling every entry (useful for many classes)
+        paste_label = tk.Label(matrix_window, text="Or paste matrix (one row per class, mapped pixels last):")
+        paste_label.grid(row=num_classes + 3, column=0, columnspan=num_classes + 2)
+        create_tooltip(
+            paste_label, "Whitespace-, tab- or comma-separated values. If filled in, this overrides the grid above."
+        )
+        matrix_text = tk.Text(matrix_window, width=60, height=min(num_classes, 10))
+        matrix_text.grid(row=num_classes + 4, column=0, columnspan=num_classes + 2, padx=10)
+
         # Add a button to run the analysis
         tk.Button(
             matrix_window, text="Run Analysis", command=run_analysis
-        ).grid(row=num_classes + 4, column=0, columnspan=num_classes + 2)
+        ).grid(row=num_classes + 5, column=0, columnspan=num_classes + 2)
 
         # Add a button to set a new number of classes
         def set_new_classes():
@@ -399,12 +427,12 @@ def setup_matrix_inputs():
 
         tk.Button(
             matrix_window, text="Set New Number of Classes", command=set_new_classes
-        ).grid(row=num_classes + 5, column=0, columnspan=num_classes + 2)
+        ).grid(row=num_classes + 6, column=0, columnspan=num_classes + 2)
 
         # Add a button to exit the application
         tk.Button(
             matrix_window, text="Exit", command=lambda: (matrix_window.destroy(), root.destroy())
-        ).grid(row=num_classes + 6, column=0, columnspan=num_classes + 2)
+        ).grid(row=num_classes + 7, column=0, columnspan=num_classes + 2)
 
     except ValueError:
         messagebox.showerror("Input Error", "Please enter a valid number of classes.")
@@ -414,6 +442,13 @@ def setup_matrix_inputs():
 root = tk.Tk()
 root.title("Land Cover Map Accuracy Assessment, Area Estimation, and Uncertainty Quantification")
 
+# Shared tooltip window, reused by every widget instead of one hidden window per entry
+tooltip = tk.Toplevel(root)
+tooltip.withdraw()  # Hide initially
+tooltip.overrideredirect(True)  # Remove window decorations (e.g., title bar)
+tooltip_label = tk.Label(tooltip, background="yellow", relief="solid", borderwidth=1, font=("Arial", 8))
+tooltip_label.pack()
+
 tk.Label(root, text="Enter number of classes:").pack()
 entry_classes = tk.Entry(root)
 entry_classes.pack()